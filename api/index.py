@@ -1,6 +1,9 @@
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 import sqlite3
+import hashlib
+import gzip
+import json
 import re
 import os
 
@@ -460,6 +463,50 @@ def get_lesson_by_id(lesson_id):
             return lesson
     return None
 
+def compute_lessons_version():
+    """Return a short content hash that changes whenever lesson data changes"""
+    payload = json.dumps(LESSONS, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+LESSONS_VERSION = compute_lessons_version()
+
+def encode_payload(payload):
+    """Serialize a payload once into its identity and gzipped bodies"""
+    body = json.dumps(payload).encode('utf-8')
+    return body, gzip.compress(body)
+
+# Lesson content is static, so every response body is encoded once at import
+BOOTSTRAP_BODIES = encode_payload({
+    'success': True,
+    'version': LESSONS_VERSION,
+    'lessons': get_all_lessons(),
+    'firstLesson': LESSONS[0] if LESSONS else None
+})
+LESSON_BODIES = {
+    lesson["id"]: encode_payload({'success': True, 'version': LESSONS_VERSION, 'lesson': lesson})
+    for lesson in LESSONS
+}
+
+def versioned_response(bodies, etag=LESSONS_VERSION):
+    """Build a JSON response from pre-encoded bodies, tagged with a weak ETag.
+
+    Each URL should pass its own etag (e.g. the version plus lesson ID) so a
+    validator from one resource never produces a 304 on another.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        body, gzipped = bodies
+        if request.accept_encodings['gzip'] > 0:
+            response = app.response_class(gzipped, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = app.response_class(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 # --- DATABASE SETUP ---
 def init_sample_database():
     """Initialize an in-memory SQLite database with Pokemon-themed data"""
@@ -646,11 +693,16 @@ def get_lessons_api():
 
 @app.route('/api/lessons/<int:lesson_id>', methods=['GET'])
 def get_lesson_api(lesson_id):
-    lesson = get_lesson_by_id(lesson_id)
-    if lesson:
-        return jsonify({'success': True, 'lesson': lesson})
+    bodies = LESSON_BODIES.get(lesson_id)
+    if bodies:
+        return versioned_response(bodies, etag=f"{LESSONS_VERSION}-{lesson_id}")
     return jsonify({'error': 'Lesson not found'}), 404
 
+@app.route('/api/bootstrap', methods=['GET'])
+def bootstrap_api():
+    """Return the lesson index, first lesson and content version in one round trip"""
+    return versioned_response(BOOTSTRAP_BODIES)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     return jsonify({'status': 'healthy'})
@@ -3,9 +3,17 @@ const API_BASE_URL = window.location.hostname === 'localhost'
     ? 'http://localhost:5000/api'
     : '/api';
 
+// Lesson Cache Configuration
+const LESSON_CACHE_KEY = 'sqlLessonCache';
+const PREFETCH_RADIUS = 2;
+
 // State Management
 let currentLesson = null;
+let requestedLessonId = null;
 let allLessons = [];
+let lessonCache = readLessonCache();
+const pendingLessons = new Map();
+let pendingIndexRefresh = null;
 
 // DOM Elements
 const lessonNav = document.getElementById('lessonNav');
@@ -37,20 +45,19 @@ function setupEventListeners() {
     });
 }
 
-// Load All Lessons
+// Load All Lessons (index + first lesson in a single round trip)
 async function loadLessons() {
     try {
-        const response = await fetch(`${API_BASE_URL}/lessons`);
-        const data = await response.json();
+        if (!await fetchBootstrap(lessonCache.version)) {
+            return;
+        }
 
-        if (data.success) {
-            allLessons = data.lessons;
-            renderLessonNav(allLessons);
+        allLessons = lessonCache.index;
+        renderLessonNav(allLessons);
 
-            // Load first lesson by default
-            if (allLessons.length > 0) {
-                loadLesson(allLessons[0].id);
-            }
+        // Load first lesson by default
+        if (allLessons.length > 0) {
+            loadLesson(allLessons[0].id);
         }
     } catch (error) {
         console.error('Error loading lessons:', error);
@@ -58,6 +65,29 @@ async function loadLessons() {
     }
 }
 
+// Fetch the Lesson Index, Revalidating Against a Known Version
+async function fetchBootstrap(knownVersion) {
+    const headers = knownVersion ? { 'If-None-Match': `W/"${knownVersion}"` } : {};
+    const response = await fetch(`${API_BASE_URL}/bootstrap`, { headers });
+
+    if (response.status === 304) {
+        return true;
+    }
+
+    const data = await response.json();
+    if (!data.success) {
+        return false;
+    }
+
+    // Version and index are always stored together, exactly as the server sent them
+    replaceLessonCache(data.version, data.lessons);
+    if (data.firstLesson) {
+        cacheLesson(data.firstLesson);
+    }
+    writeLessonCache();
+    return true;
+}
+
 // Render Lesson Navigation
 function renderLessonNav(lessons) {
     // Group lessons by category
@@ -90,23 +120,25 @@ function renderLessonNav(lessons) {
 
 // Load Specific Lesson
 async function loadLesson(lessonId) {
+    requestedLessonId = lessonId;
+
     try {
-        // Update active state in nav
-        document.querySelectorAll('.lesson-item').forEach(item => {
-            item.classList.remove('active');
-        });
-        const activeItem = document.querySelector(`[data-lesson-id="${lessonId}"]`);
-        if (activeItem) {
-            activeItem.classList.add('active');
-        }
+        highlightLesson(lessonId);
 
-        // Fetch lesson content
-        const response = await fetch(`${API_BASE_URL}/lessons/${lessonId}`);
-        const data = await response.json();
+        // Serve from cache, falling back to the network
+        const lesson = lessonCache.lessons[lessonId] || await fetchLesson(lessonId);
 
-        if (data.success) {
-            currentLesson = data.lesson;
+        // A later click superseded this one while it was loading
+        if (lessonId !== requestedLessonId) {
+            return;
+        }
+
+        if (lesson) {
+            // The nav may have been re-rendered while the lesson was loading
+            highlightLesson(lessonId);
+            currentLesson = lesson;
             renderLesson(currentLesson);
+            schedulePrefetch(lessonId);
         }
     } catch (error) {
         console.error('Error loading lesson:', error);
@@ -114,6 +146,130 @@ async function loadLesson(lessonId) {
     }
 }
 
+// Update Active State in Nav
+function highlightLesson(lessonId) {
+    document.querySelectorAll('.lesson-item').forEach(item => {
+        item.classList.remove('active');
+    });
+    const activeItem = document.querySelector(`[data-lesson-id="${lessonId}"]`);
+    if (activeItem) {
+        activeItem.classList.add('active');
+    }
+}
+
+// Fetch a Lesson and Store it in the Cache (one request per lesson at a time)
+function fetchLesson(lessonId) {
+    if (!pendingLessons.has(lessonId)) {
+        const request = requestLesson(lessonId).finally(() => {
+            pendingLessons.delete(lessonId);
+        });
+        pendingLessons.set(lessonId, request);
+    }
+    return pendingLessons.get(lessonId);
+}
+
+async function requestLesson(lessonId, retryIfStale = true) {
+    const startVersion = lessonCache.version;
+    const response = await fetch(`${API_BASE_URL}/lessons/${lessonId}`);
+    const data = await response.json();
+
+    if (!data.success) {
+        return null;
+    }
+
+    if (data.version !== lessonCache.version) {
+        if (lessonCache.version === startVersion) {
+            // Content changed on the server since bootstrap; reload the index for the new version
+            await refreshLessonIndex();
+        } else if (retryIfStale) {
+            // The index was refreshed while this request was in flight, so the response may be stale
+            return requestLesson(lessonId, false);
+        }
+    }
+
+    // Never show or cache a lesson that doesn't match the current index
+    if (data.version !== lessonCache.version) {
+        return null;
+    }
+    cacheLesson(data.lesson);
+    writeLessonCache();
+    return data.lesson;
+}
+
+// Replace a Stale Lesson Index (shared by concurrent callers)
+function refreshLessonIndex() {
+    if (!pendingIndexRefresh) {
+        pendingIndexRefresh = reloadLessonIndex().finally(() => {
+            pendingIndexRefresh = null;
+        });
+    }
+    return pendingIndexRefresh;
+}
+
+async function reloadLessonIndex() {
+    if (!await fetchBootstrap(null)) {
+        return;
+    }
+
+    allLessons = lessonCache.index;
+    renderLessonNav(allLessons);
+    if (requestedLessonId !== null) {
+        highlightLesson(requestedLessonId);
+    }
+}
+
+// Prefetch Neighbouring Lessons While the Browser is Idle
+function schedulePrefetch(lessonId) {
+    const idle = window.requestIdleCallback || (callback => setTimeout(callback, 200));
+    idle(() => {
+        const position = allLessons.findIndex(lesson => lesson.id === lessonId);
+        if (position === -1) {
+            return;
+        }
+
+        const start = Math.max(0, position - PREFETCH_RADIUS);
+        const nearby = allLessons.slice(start, position + PREFETCH_RADIUS + 1);
+        nearby
+            .filter(lesson => !lessonCache.lessons[lesson.id] && !pendingLessons.has(lesson.id))
+            .forEach(lesson => {
+                fetchLesson(lesson.id).catch(error => {
+                    console.error('Error prefetching lesson:', error);
+                });
+            });
+    });
+}
+
+// Lesson Cache Helpers (in memory, persisted to localStorage)
+function readLessonCache() {
+    try {
+        const stored = JSON.parse(localStorage.getItem(LESSON_CACHE_KEY));
+        if (stored && stored.version && Array.isArray(stored.index) && stored.lessons) {
+            return stored;
+        }
+    } catch (error) {
+        console.error('Error reading lesson cache:', error);
+    }
+    return { version: null, index: [], lessons: {} };
+}
+
+function writeLessonCache() {
+    try {
+        localStorage.setItem(LESSON_CACHE_KEY, JSON.stringify(lessonCache));
+    } catch (error) {
+        // Storage may be full or disabled; the in-memory cache still works
+        console.error('Error saving lesson cache:', error);
+    }
+}
+
+function replaceLessonCache(version, index) {
+    const lessons = version === lessonCache.version ? lessonCache.lessons : {};
+    lessonCache = { version, index, lessons };
+}
+
+function cacheLesson(lesson) {
+    lessonCache.lessons[lesson.id] = lesson;
+}
+
 // Render Lesson Content
 function renderLesson(lesson) {
     // Update header